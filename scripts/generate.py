@@ -12,6 +12,8 @@ Options:
   --url <url>      Fetch spec from URL (default: http://localhost:8080/openapi.json)
   --file <path>    Read spec from local file
   --output <path>  Output file path (default: src/types.rs)
+  --no-cache       Always re-parse the spec instead of using the on-disk cache
+  --jobs <n>       Render schemas in n worker processes (default: 1, 0 = one per CPU)
   --help           Show this help message
 
 Environment Variables:
@@ -20,28 +22,95 @@ Environment Variables:
 """
 
 import argparse
+import contextlib
+import gzip
+import hashlib
+import io
 import json
+import marshal
 import os
+import re
 import sys
+import urllib.parse
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Iterator, Optional, Sequence, TextIO
+
+# orjson parses large specs considerably faster; fall back to the stdlib
+# parser so the script keeps working without extra dependencies.
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# urllib3 adds connection reuse and transparent decompression for spec
+# fetches; without it we fall back to urllib and decode gzip ourselves.
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+_http = urllib3.PoolManager() if urllib3 is not None else None
+
+# urllib3 proxy pools keyed by proxy URL, created as proxies are needed
+_proxy_pools: dict[str, Any] = {}
 
 DEFAULT_SPEC_URL = "http://localhost:8080/openapi.json"
 DEFAULT_OUTPUT = "src/types.rs"
 
+# Write buffer for the generated file, so output reaches the OS in large chunks
+OUTPUT_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Parsed specs are cached here, keyed by the SHA-256 of the raw spec bytes
+SPEC_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "refyne-sdk"
+
 # Rust reserved keywords that need to be renamed
-RUST_KEYWORDS = {
+RUST_KEYWORDS = frozenset({
     "type", "fn", "let", "const", "static", "mut", "ref", "self", "super",
     "crate", "mod", "pub", "use", "struct", "enum", "trait", "impl", "for",
     "where", "loop", "while", "if", "else", "match", "return", "break",
     "continue", "move", "box", "async", "await", "dyn", "abstract", "become",
     "do", "final", "macro", "override", "priv", "typeof", "unsized", "virtual",
     "yield", "try", "union", "in", "as"
-}
+})
+
+# Names longer than the longest keyword can skip the keyword lookup
+_MAX_KEYWORD_LEN = max(map(len, RUST_KEYWORDS))
+
+# Word boundaries for snake_case conversion: an uppercase letter after a
+# lowercase one ("fooBar"), or the last capital of an acronym ("HTTPUrl").
+# ASCII only - re has no Unicode case classes, see to_snake_case.
+_SNAKE_CASE_BOUNDARY = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=.)(?=[A-Z][a-z])")
+
+# Shared read-only defaults for missing schema keys, so lookups on the hot
+# path don't allocate a fresh empty container each time
+_EMPTY_DICT = MappingProxyType({})
+_EMPTY_TUPLE = ()
+
+# Finds an uppercase letter; enums with none use rename_all = "lowercase"
+_HAS_UPPER = re.compile(r"[A-Z]").search
+
+# Type name suffixes used to classify schemas. OutputBody/ResponseBody are
+# response types even though they could otherwise read as request suffixes.
+_REQUEST_SUFFIXES = ("Request", "Input", "InputBody")
+_RESPONSE_SUFFIXES = ("Response", "Output", "Result", "OutputBody", "ResponseBody")
+_RESPONSE_BODY_SUFFIXES = ("OutputBody", "ResponseBody")
 
 # Collected inline enums during processing
-inline_enums: dict[str, list[str]] = {}
+inline_enums: dict[str, tuple[str, ...]] = {}
+
+# Inline enums whose values duplicate another inline enum, mapped to the
+# enum actually generated for those values
+inline_enum_aliases: dict[str, str] = {}
+
+# Names of schemas with required enum fields (these can't derive Default)
+required_enum_schemas: set[str] = set()
+
+# Component definitions by JSON reference (e.g. "#/components/schemas/Foo")
+ref_index: dict[str, dict] = {}
 
 
 def parse_args() -> argparse.Namespace:
@@ -79,9 +148,25 @@ Examples:
         default=DEFAULT_OUTPUT,
         help=f"Output file path (default: {DEFAULT_OUTPUT})"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the spec instead of using the on-disk cache"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Render schemas in N worker processes (default: 1, 0 = one per CPU)"
+    )
 
     args = parser.parse_args()
 
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive number")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+
     # Check environment variables if not set via CLI
     if args.file is None and args.url is None:
         if os.environ.get("OPENAPI_SPEC_FILE"):
@@ -94,26 +179,89 @@ Examples:
     return args
 
 
-def fetch_spec(url: str) -> dict:
+def parse_spec(raw: bytes, use_cache: bool = True) -> dict:
+    """Parse raw OpenAPI spec bytes, reusing a cached parse of identical content."""
+    if not use_cache:
+        return _json.loads(raw)
+
+    cache_path = SPEC_CACHE_DIR / f"spec-{hashlib.sha256(raw).hexdigest()}.marshal"
+    try:
+        with open(cache_path, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    spec = _json.loads(raw)
+
+    # A cache we can't write is not an error - we just parse again next time
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        SPEC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump(spec, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        # Don't leave a partial cache file behind
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+    return spec
+
+
+def _pool_for_url(url: str) -> Any:
+    """Pick the urllib3 pool for a URL, honouring proxy settings as urllib does."""
+    parsed = urllib.parse.urlsplit(url)
+    proxy_url = urllib.request.getproxies().get(parsed.scheme)
+    if not proxy_url or urllib.request.proxy_bypass(parsed.netloc):
+        return _http
+
+    # urllib accepts "host:port" proxies, urllib3 needs a scheme
+    if "://" not in proxy_url:
+        proxy_url = f"http://{proxy_url}"
+    if proxy_url not in _proxy_pools:
+        _proxy_pools[proxy_url] = urllib3.ProxyManager(proxy_url)
+    return _proxy_pools[proxy_url]
+
+
+def fetch_spec(url: str, use_cache: bool = True) -> dict:
     """Fetch OpenAPI spec from URL."""
     print(f"Fetching OpenAPI spec from: {url}")
+    if _http is not None:
+        try:
+            response = _pool_for_url(url).request(
+                "GET", url, headers={"Accept-Encoding": "gzip, deflate"}, timeout=30
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise RuntimeError(f"Failed to fetch spec: {e}")
+        if response.status >= 400:
+            raise RuntimeError(f"Failed to fetch spec: HTTP {response.status} {response.reason}")
+        return parse_spec(response.data, use_cache)
+
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            return json.loads(response.read().decode("utf-8"))
+        with urllib.request.urlopen(request, timeout=30) as response:
+            raw = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                raw = gzip.decompress(raw)
     except urllib.error.URLError as e:
         raise RuntimeError(f"Failed to fetch spec: {e}")
+    return parse_spec(raw, use_cache)
 
 
-def load_spec_from_file(file_path: str) -> dict:
-    """Load OpenAPI spec from a local file."""
+def load_spec_from_file(file_path: str, use_cache: bool = True) -> dict:
+    """Load OpenAPI spec from a local file (path already resolved by the caller)."""
     print(f"Loading OpenAPI spec from file: {file_path}")
-    path = Path(file_path).resolve()
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        return parse_spec(f.read(), use_cache)
 
 
+@lru_cache(maxsize=None)
 def to_snake_case(name: str) -> str:
     """Convert camelCase or PascalCase to snake_case."""
+    if name.isascii():
+        return _SNAKE_CASE_BOUNDARY.sub("_", name).lower()
+
+    # Non-ASCII names need the Unicode-aware str.isupper/islower checks
     result = []
     for i, char in enumerate(name):
         if char.isupper():
@@ -125,20 +273,36 @@ def to_snake_case(name: str) -> str:
     return "".join(result)
 
 
+@lru_cache(maxsize=None)
 def to_pascal_case(name: str) -> str:
     """Convert snake_case or kebab-case to PascalCase."""
     return "".join(word.capitalize() for word in name.replace("-", "_").split("_"))
 
 
+@lru_cache(maxsize=None)
 def escape_rust_keyword(name: str) -> str:
     """Escape Rust keywords by prefixing with r#."""
-    if name in RUST_KEYWORDS:
+    if len(name) <= _MAX_KEYWORD_LEN and name in RUST_KEYWORDS:
         return f"r#{name}"
     return name
 
 
+def build_ref_index(spec: dict) -> dict[str, dict]:
+    """Index every component definition in the spec by its JSON reference."""
+    return {
+        f"#/components/{section}/{name}": definition
+        for section, definitions in spec.get("components", {}).items()
+        if isinstance(definitions, dict)
+        for name, definition in definitions.items()
+    }
+
+
 def resolve_ref(ref: str, spec: dict) -> dict:
     """Resolve a JSON reference to its schema."""
+    if ref in ref_index:
+        return ref_index[ref]
+
+    # Refs outside components aren't indexed, walk the spec instead
     ref_path = ref.replace("#/", "").split("/")
     current = spec
     for part in ref_path:
@@ -146,11 +310,86 @@ def resolve_ref(ref: str, spec: dict) -> dict:
     return current
 
 
+@lru_cache(maxsize=None)
 def make_enum_name(parent_type: str, field_name: str) -> str:
     """Generate an enum name from parent type and field name."""
     return f"{parent_type}{to_pascal_case(field_name)}"
 
 
+# Handlers used by openapi_type_to_rust. Each returns the Rust type of a
+# required value; the caller wraps it in Option<> when needed.
+def _all_of_to_rust(schema: dict, spec: dict, parent_type: str, field_name: str) -> str:
+    # For allOf, take the first ref or combine
+    types = [openapi_type_to_rust(s, spec, True) for s in schema["allOf"]]
+    # Usually allOf is used for composition, use first type
+    return types[0] if types else "serde_json::Value"
+
+
+def _one_of_to_rust(schema: dict, spec: dict, parent_type: str, field_name: str) -> str:
+    # For oneOf/anyOf, use serde_json::Value as a catch-all
+    return "serde_json::Value"
+
+
+def _enum_to_rust(schema: dict, spec: dict, parent_type: str, field_name: str) -> str:
+    # Generate a proper enum for inline enums
+    if parent_type and field_name:
+        enum_name = make_enum_name(parent_type, field_name)
+        inline_enums[enum_name] = tuple(schema["enum"])
+        return inline_enum_aliases.get(enum_name, enum_name)
+    # Fallback to String for enums without context
+    return "String"
+
+
+def _array_to_rust(schema: dict, spec: dict, parent_type: str, field_name: str) -> str:
+    items = schema.get("items") or _EMPTY_DICT
+    item_type = openapi_type_to_rust(items, spec, True, parent_type, field_name)
+    return f"Vec<{item_type}>"
+
+
+def _object_to_rust(schema: dict, spec: dict, parent_type: str, field_name: str) -> str:
+    additional_props = schema.get("additionalProperties")
+    if isinstance(additional_props, dict):
+        value_type = openapi_type_to_rust(additional_props, spec, True, parent_type, field_name)
+        return f"std::collections::HashMap<String, {value_type}>"
+    # Free-form and inline objects - use Value
+    return "serde_json::Value"
+
+
+def _value_to_rust(schema: dict, spec: dict, parent_type: str, field_name: str) -> str:
+    return "serde_json::Value"
+
+
+# Keywords that take precedence over "type", in the order they are checked
+# ($ref comes first and is handled inline by openapi_type_to_rust)
+_COMPOUND_HANDLERS = {
+    "allOf": _all_of_to_rust,
+    "oneOf": _one_of_to_rust,
+    "anyOf": _one_of_to_rust,
+    "enum": _enum_to_rust,
+}
+_COMPOUND_KEYS = frozenset(_COMPOUND_HANDLERS)
+
+# (required, optional) Rust types for scalar OpenAPI types, by format. The
+# None entry is the default for other formats (i64 for integers, f64 for numbers).
+_SCALAR_TYPES = {
+    "string": {None: ("String", "Option<String>")},
+    "integer": {None: ("i64", "Option<i64>"), "int32": ("i32", "Option<i32>")},
+    "number": {None: ("f64", "Option<f64>"), "float": ("f32", "Option<f32>")},
+    "boolean": {None: ("bool", "Option<bool>")},
+}
+
+_TYPE_HANDLERS = {
+    "array": _array_to_rust,
+    "object": _object_to_rust,
+}
+
+
+@lru_cache(maxsize=None)
+def option_type(rust_type: str) -> str:
+    """Wrap a Rust type in Option<>, sharing one interned string per type."""
+    return sys.intern(f"Option<{rust_type}>")
+
+
 def openapi_type_to_rust(
     schema: dict,
     spec: dict,
@@ -159,106 +398,45 @@ def openapi_type_to_rust(
     field_name: str = ""
 ) -> str:
     """Convert an OpenAPI schema type to a Rust type string."""
-    global inline_enums
-
+    # $ref is by far the most common compound form, so it skips the tables
     if "$ref" in schema:
-        ref_name = schema["$ref"].split("/")[-1]
-        rust_type = ref_name
-        return rust_type if is_required else f"Option<{rust_type}>"
-
-    if "allOf" in schema:
-        # For allOf, take the first ref or combine
-        types = [openapi_type_to_rust(s, spec, True) for s in schema["allOf"]]
-        # Usually allOf is used for composition, use first type
-        rust_type = types[0] if types else "serde_json::Value"
-        return rust_type if is_required else f"Option<{rust_type}>"
-
-    if "oneOf" in schema or "anyOf" in schema:
-        # For oneOf/anyOf, use serde_json::Value as a catch-all
-        return "serde_json::Value" if is_required else "Option<serde_json::Value>"
-
-    if "enum" in schema:
-        # Generate a proper enum for inline enums
-        if parent_type and field_name:
-            enum_name = make_enum_name(parent_type, field_name)
-            inline_enums[enum_name] = schema["enum"]
-            return enum_name if is_required else f"Option<{enum_name}>"
-        # Fallback to String for enums without context
-        return "String" if is_required else "Option<String>"
-
-    schema_type = schema.get("type", "object")
-    schema_format = schema.get("format")
-
-    if schema_type == "string":
-        rust_type = "String"
-    elif schema_type == "integer":
-        if schema_format == "int64":
-            rust_type = "i64"
-        elif schema_format == "int32":
-            rust_type = "i32"
-        else:
-            rust_type = "i64"  # Default to i64 for integers
-    elif schema_type == "number":
-        if schema_format == "float":
-            rust_type = "f32"
-        else:
-            rust_type = "f64"  # Default to f64 for numbers
-    elif schema_type == "boolean":
-        rust_type = "bool"
-    elif schema_type == "array":
-        items = schema.get("items", {})
-        item_type = openapi_type_to_rust(items, spec, True, parent_type, field_name)
-        rust_type = f"Vec<{item_type}>"
-    elif schema_type == "object":
-        additional_props = schema.get("additionalProperties")
-        if additional_props is True:
-            rust_type = "serde_json::Value"
-        elif isinstance(additional_props, dict):
-            value_type = openapi_type_to_rust(additional_props, spec, True, parent_type, field_name)
-            rust_type = f"std::collections::HashMap<String, {value_type}>"
-        elif schema.get("properties"):
-            # Inline object - use Value
-            rust_type = "serde_json::Value"
-        else:
-            rust_type = "serde_json::Value"
+        rust_type = schema["$ref"].split("/")[-1]
+        return rust_type if is_required else option_type(rust_type)
+
+    if _COMPOUND_KEYS.isdisjoint(schema):
+        schema_type = schema.get("type", "object")
+        try:
+            formats = _SCALAR_TYPES.get(schema_type)
+        except TypeError:
+            # OpenAPI 3.1 type lists are unhashable, and fall back to Value anyway
+            formats = schema_type = None
+
+        # Scalars resolve straight from the table, without a handler call
+        if formats is not None:
+            rust_types = formats.get(schema.get("format")) or formats[None]
+            return rust_types[0] if is_required else rust_types[1]
+
+        handler = _TYPE_HANDLERS.get(schema_type, _value_to_rust)
     else:
-        rust_type = "serde_json::Value"
+        for keyword, handler in _COMPOUND_HANDLERS.items():
+            if keyword in schema:
+                break
 
-    return rust_type if is_required else f"Option<{rust_type}>"
+    rust_type = handler(schema, spec, parent_type, field_name)
+    return rust_type if is_required else option_type(rust_type)
 
 
+@lru_cache(maxsize=None)
 def is_request_type(name: str) -> bool:
     """Check if a type name represents a request type."""
     # InputBody is a request type, but OutputBody/ResponseBody are response types
-    if name.endswith("OutputBody") or name.endswith("ResponseBody"):
-        return False
-    return name.endswith("Request") or name.endswith("Input") or name.endswith("InputBody")
+    return name.endswith(_REQUEST_SUFFIXES) and not name.endswith(_RESPONSE_BODY_SUFFIXES)
 
 
+@lru_cache(maxsize=None)
 def is_response_type(name: str) -> bool:
     """Check if a type name represents a response type."""
-    return (
-        name.endswith("Response") or
-        name.endswith("Output") or
-        name.endswith("Result") or
-        name.endswith("OutputBody") or
-        name.endswith("ResponseBody")
-    )
-
-
-def has_required_enum_fields(schema: dict) -> bool:
-    """Check if schema has required fields that are enums."""
-    required = set(schema.get("required", []))
-    properties = schema.get("properties", {})
-
-    for prop_name, prop_schema in properties.items():
-        if prop_name in required:
-            # Check if field is an enum (either inline or ref)
-            if "enum" in prop_schema:
-                return True
-            # For refs, we can't easily check, so assume they might be enums
-            # Actually, most refs will be to complex types, not enums
-    return False
+    return name.endswith(_RESPONSE_SUFFIXES)
 
 
 def get_serde_attributes(name: str, schema: dict) -> list[str]:
@@ -271,30 +449,28 @@ def get_serde_attributes(name: str, schema: dict) -> list[str]:
     attrs.extend(["Serialize", "Deserialize"])
 
     # Add Default for request types without required enum fields
-    if is_request_type(name) and not has_required_enum_fields(schema):
+    if is_request_type(name) and name not in required_enum_schemas:
         attrs.append("Default")
 
     return attrs
 
 
-def generate_enum(name: str, values: list[str], description: str = "") -> list[str]:
-    """Generate a Rust enum from enum values."""
-    lines = []
-
+def generate_enum(name: str, values: Sequence[str], out: TextIO, description: str = "") -> None:
+    """Write a Rust enum from enum values."""
     # Doc comment
     if description:
-        lines.append(f"/// {description}")
+        out.write(f"/// {description}\n")
 
     # Derive attributes
-    lines.append("#[derive(Debug, Clone, Copy, Serialize, Deserialize, PartialEq, Eq)]")
+    out.write("#[derive(Debug, Clone, Copy, Serialize, Deserialize, PartialEq, Eq)]\n")
 
     # Determine rename strategy
-    all_lowercase = all(v == v.lower() for v in values)
+    all_lowercase = not any(_HAS_UPPER(v) for v in values)
 
     if all_lowercase:
-        lines.append('#[serde(rename_all = "lowercase")]')
+        out.write('#[serde(rename_all = "lowercase")]\n')
 
-    lines.append(f"pub enum {name} {{")
+    out.write(f"pub enum {name} {{\n")
 
     for value in values:
         # Convert to PascalCase for Rust variant
@@ -302,141 +478,202 @@ def generate_enum(name: str, values: list[str], description: str = "") -> list[s
 
         # Add serde rename if needed (for non-lowercase variants)
         if not all_lowercase:
-            lines.append(f'    #[serde(rename = "{value}")]')
-
-        lines.append(f"    /// {value}")
-        lines.append(f"    {variant},")
+            out.write(f'    #[serde(rename = "{value}")]\n')
 
-    lines.append("}")
-    return lines
+        out.write(f"    /// {value}\n")
+        out.write(f"    {variant},\n")
 
+    out.write("}\n")
 
-def generate_struct(name: str, schema: dict, spec: dict) -> list[str]:
-    """Generate a Rust struct from an OpenAPI schema."""
-    lines = []
 
+def generate_struct(name: str, schema: dict, spec: dict, out: TextIO) -> None:
+    """Write a Rust struct from an OpenAPI schema."""
     # Doc comment
     description = schema.get("description", "")
     if description:
-        lines.append(f"/// {description}")
+        out.write(f"/// {description}\n")
     if schema.get("deprecated"):
         msg = schema.get("x-deprecated-message", "This type is deprecated.")
-        lines.append(f"#[deprecated(note = \"{msg}\")]")
+        out.write(f"#[deprecated(note = \"{msg}\")]\n")
 
     # Derive attributes
     derives = get_serde_attributes(name, schema)
-    lines.append(f"#[derive({', '.join(derives)})]")
+    out.write(f"#[derive({', '.join(derives)})]\n")
 
     # Check if any fields use snake_case (have underscores)
-    properties = schema.get("properties", {})
+    properties = schema.get("properties") or _EMPTY_DICT
     has_snake_case = any("_" in k for k in properties.keys())
 
     # Only add rename_all if fields don't have underscores (are camelCase)
     if not has_snake_case and properties:
-        lines.append('#[serde(rename_all = "camelCase")]')
+        out.write('#[serde(rename_all = "camelCase")]\n')
 
-    lines.append(f"pub struct {name} {{")
+    out.write(f"pub struct {name} {{\n")
 
-    required_fields = set(schema.get("required", []))
+    required_fields = frozenset(schema.get("required") or _EMPTY_TUPLE)
+    is_request = is_request_type(name)
 
     for prop_name, prop_schema in properties.items():
         # Skip JSON Schema metadata fields (like $schema)
         if prop_name.startswith("$"):
             continue
         is_required = prop_name in required_fields
-        rust_field_name = to_snake_case(prop_name)
-        rust_field_name = escape_rust_keyword(rust_field_name)
+        rust_field_name = escape_rust_keyword(to_snake_case(prop_name))
         rust_type = openapi_type_to_rust(prop_schema, spec, is_required, name, prop_name)
 
         # Doc comment for field
         prop_description = prop_schema.get("description", "")
         if prop_description:
-            lines.append(f"    /// {prop_description}")
+            out.write(f"    /// {prop_description}\n")
         if prop_schema.get("deprecated"):
             msg = prop_schema.get("x-deprecated-message", "This field is deprecated.")
-            lines.append(f"    #[deprecated(note = \"{msg}\")]")
+            out.write(f"    #[deprecated(note = \"{msg}\")]\n")
 
-        # Add serde rename for fields that need it
-        actual_field_name = rust_field_name.replace("r#", "")
-        needs_rename = False
-
-        # Need rename if field is a Rust keyword
-        if actual_field_name != rust_field_name.replace("r#", ""):
-            needs_rename = True
-        # Need rename if original has underscores but we converted to snake_case differently
-        elif "_" not in prop_name and has_snake_case:
-            needs_rename = True
-
-        if needs_rename:
-            lines.append(f'    #[serde(rename = "{prop_name}")]')
+        # Keyword fields need no rename: serde strips the r# prefix itself.
+        # Camel-case fields need one when rename_all is off for this struct.
+        if has_snake_case and "_" not in prop_name:
+            out.write(f'    #[serde(rename = "{prop_name}")]\n')
 
         # Skip serializing None for optional fields in request types
-        if not is_required and is_request_type(name):
-            lines.append("    #[serde(skip_serializing_if = \"Option::is_none\")]")
-
-        lines.append(f"    pub {rust_field_name}: {rust_type},")
+        if not is_required and is_request:
+            out.write("    #[serde(skip_serializing_if = \"Option::is_none\")]\n")
 
-    lines.append("}")
-    return lines
+        out.write(f"    pub {rust_field_name}: {rust_type},\n")
 
+    out.write("}\n")
 
-def generate_type_alias(name: str, schema: dict, spec: dict) -> list[str]:
-    """Generate a Rust type alias from an OpenAPI schema."""
-    lines = []
 
+def generate_type_alias(name: str, schema: dict, spec: dict, out: TextIO) -> None:
+    """Write a Rust type alias from an OpenAPI schema."""
     description = schema.get("description", "")
     if description:
-        lines.append(f"/// {description}")
+        out.write(f"/// {description}\n")
 
     rust_type = openapi_type_to_rust(schema, spec, True)
-    lines.append(f"pub type {name} = {rust_type};")
+    out.write(f"pub type {name} = {rust_type};\n")
+
+
+def generate_schema(
+    name: str,
+    schema: dict,
+    spec: dict,
+    out: TextIO,
+    struct_for_all_of: bool = False
+) -> None:
+    """Write a Rust struct or type alias for a named OpenAPI schema."""
+    if schema.get("type") == "object" or "properties" in schema:
+        generate_struct(name, schema, spec, out)
+    elif struct_for_all_of and "allOf" in schema:
+        generate_struct(name, schema, spec, out)
+    else:
+        generate_type_alias(name, schema, spec, out)
 
-    return lines
 
+# Spec and classification state for schema rendering worker processes
+_worker_spec: dict = {}
 
-def generate_types(spec: dict) -> str:
-    """Generate all Rust types from an OpenAPI spec."""
-    global inline_enums
+
+def _init_schema_worker(
+    spec: dict,
+    required_enums: set[str],
+    enum_aliases: dict[str, str]
+) -> None:
+    """Install the parent's spec and classification state in a worker process."""
+    global _worker_spec, required_enum_schemas, inline_enum_aliases
+    _worker_spec = spec
+    required_enum_schemas = required_enums
+    inline_enum_aliases = enum_aliases
+
+
+def _render_schema_worker(item: tuple[str, dict, bool]) -> tuple[str, dict[str, tuple[str, ...]]]:
+    """Render one schema in a worker process."""
+    name, schema, struct_for_all_of = item
+    # Report the inline enums this schema registers so the parent can merge them
+    inline_enums.clear()
+    out = io.StringIO()
+    generate_schema(name, schema, _worker_spec, out, struct_for_all_of)
+    return out.getvalue(), dict(inline_enums)
+
+
+def render_schemas_parallel(
+    items: list[tuple[str, dict, bool]],
+    spec: dict,
+    jobs: int
+) -> Iterator[str]:
+    """Render (name, schema, struct_for_all_of) items across worker processes.
+
+    Returns the rendered code for each item in order. Inline enums registered
+    by the workers are merged into inline_enums.
+    """
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_schema_worker,
+        initargs=(spec, required_enum_schemas, inline_enum_aliases),
+    ) as executor:
+        results = list(executor.map(_render_schema_worker, items, chunksize=chunksize))
+
+    for _, enums in results:
+        inline_enums.update(enums)
+    return iter([code for code, _ in results])
+
+
+def write_section_header(title: str, out: TextIO) -> None:
+    """Write a banner comment introducing a section of generated types."""
+    out.write(f"// {'=' * 76}\n// {title}\n// {'=' * 76}\n\n")
+
+
+def generate_types(spec: dict, out: TextIO, jobs: int = 1) -> None:
+    """Write all Rust types from an OpenAPI spec, using `jobs` worker processes."""
+    global inline_enums, inline_enum_aliases, required_enum_schemas, ref_index
     inline_enums = {}  # Reset for each run
+    inline_enum_aliases = {}
+    required_enum_schemas = set()
+    ref_index = build_ref_index(spec)
 
     api_version = spec.get("info", {}).get("version", "unknown")
 
-    lines = [
-        "//! API types for the Refyne SDK.",
-        "//!",
-        "//! These types are generated from the OpenAPI specification.",
-        "//! Do not edit this file manually - run `make generate` to regenerate.",
-        "//!",
-        f"//! Generated from API version: {api_version}",
-        "",
-        "#![allow(dead_code)]",
-        "",
-        "use serde::{Deserialize, Serialize};",
-        "",
-    ]
+    out.write(
+        "//! API types for the Refyne SDK.\n"
+        "//!\n"
+        "//! These types are generated from the OpenAPI specification.\n"
+        "//! Do not edit this file manually - run `make generate` to regenerate.\n"
+        "//!\n"
+        f"//! Generated from API version: {api_version}\n"
+        "\n"
+        "#![allow(dead_code)]\n"
+        "\n"
+        "use serde::{Deserialize, Serialize};\n"
+        "\n"
+    )
 
     schemas = spec.get("components", {}).get("schemas", {})
 
     if not schemas:
-        lines.append("// No schemas found in OpenAPI specification")
-        return "\n".join(lines)
+        out.write("// No schemas found in OpenAPI specification\n")
+        return
 
-    # First pass: collect all inline enums
-    for name, schema in schemas.items():
-        if schema.get("type") == "object" or "properties" in schema:
-            for prop_name, prop_schema in schema.get("properties", {}).items():
-                if "enum" in prop_schema and prop_schema.get("type") == "string":
-                    enum_name = make_enum_name(name, prop_name)
-                    inline_enums[enum_name] = prop_schema["enum"]
-
-    # Group schemas by category
+    # Single pass: collect inline enums and group schemas by category
     request_schemas = []
     response_schemas = []
     enum_schemas = []
     other_schemas = []
 
     for name, schema in schemas.items():
-        if "enum" in schema and "properties" not in schema:
+        has_properties = "properties" in schema
+
+        if has_properties or schema.get("type") == "object":
+            required = frozenset(schema.get("required") or _EMPTY_TUPLE)
+            for prop_name, prop_schema in (schema.get("properties") or _EMPTY_DICT).items():
+                if "enum" not in prop_schema:
+                    continue
+                if prop_name in required:
+                    required_enum_schemas.add(name)
+                if prop_schema.get("type") == "string":
+                    enum_name = make_enum_name(name, prop_name)
+                    inline_enums[enum_name] = tuple(prop_schema["enum"])
+
+        if "enum" in schema and not has_properties:
             enum_schemas.append((name, schema))
         elif is_request_type(name):
             request_schemas.append((name, schema))
@@ -445,108 +682,104 @@ def generate_types(spec: dict) -> str:
         else:
             other_schemas.append((name, schema))
 
+    # Inline enums with the same set of values share one Rust enum, defined
+    # under the alphabetically first name; the other names become aliases
+    top_enum_names = frozenset(name for name, _ in enum_schemas)
+    enum_by_values: dict[frozenset, str] = {}
+    for enum_name, values in sorted(inline_enums.items()):
+        if enum_name in top_enum_names:
+            continue
+        canonical = enum_by_values.setdefault(frozenset(values), enum_name)
+        if canonical != enum_name:
+            inline_enum_aliases[enum_name] = canonical
+
     # Generate top-level enums first
     if enum_schemas or inline_enums:
-        lines.append("// " + "=" * 76)
-        lines.append("// Enums")
-        lines.append("// " + "=" * 76)
-        lines.append("")
+        write_section_header("Enums", out)
 
         # Top-level enums from schema
         for name, schema in enum_schemas:
-            lines.extend(generate_enum(name, schema.get("enum", []), schema.get("description", "")))
-            lines.append("")
+            generate_enum(name, schema.get("enum", []), out, schema.get("description", ""))
+            out.write("\n")
 
         # Inline enums collected during processing
         for enum_name, values in sorted(inline_enums.items()):
             # Skip if already generated as top-level
-            if any(name == enum_name for name, _ in enum_schemas):
+            if enum_name in top_enum_names:
                 continue
-            lines.extend(generate_enum(enum_name, values))
-            lines.append("")
-
-    # Generate request types
-    if request_schemas:
-        lines.append("// " + "=" * 76)
-        lines.append("// Request Types")
-        lines.append("// " + "=" * 76)
-        lines.append("")
-        for name, schema in request_schemas:
-            if schema.get("type") == "object" or "properties" in schema:
-                lines.extend(generate_struct(name, schema, spec))
-            else:
-                lines.extend(generate_type_alias(name, schema, spec))
-            lines.append("")
-
-    # Generate response types
-    if response_schemas:
-        lines.append("// " + "=" * 76)
-        lines.append("// Response Types")
-        lines.append("// " + "=" * 76)
-        lines.append("")
-        for name, schema in response_schemas:
-            if schema.get("type") == "object" or "properties" in schema:
-                lines.extend(generate_struct(name, schema, spec))
+            canonical = inline_enum_aliases.get(enum_name)
+            if canonical:
+                out.write(f"/// Same values as [`{canonical}`].\n")
+                out.write(f"pub type {enum_name} = {canonical};\n")
             else:
-                lines.extend(generate_type_alias(name, schema, spec))
-            lines.append("")
-
-    # Generate other types
-    if other_schemas:
-        lines.append("// " + "=" * 76)
-        lines.append("// Other Types")
-        lines.append("// " + "=" * 76)
-        lines.append("")
-        for name, schema in other_schemas:
-            if schema.get("type") == "object" or "properties" in schema:
-                lines.extend(generate_struct(name, schema, spec))
-            elif "allOf" in schema:
-                lines.extend(generate_struct(name, schema, spec))
+                generate_enum(enum_name, values, out)
+            out.write("\n")
+
+    # Generate request, response and other types. Only the "other" section
+    # renders allOf compositions as structs.
+    sections = [
+        ("Request Types", request_schemas, False),
+        ("Response Types", response_schemas, False),
+        ("Other Types", other_schemas, True),
+    ]
+
+    rendered = None
+    if jobs > 1:
+        rendered = render_schemas_parallel(
+            [
+                (name, schema, struct_for_all_of)
+                for _, section_schemas, struct_for_all_of in sections
+                for name, schema in section_schemas
+            ],
+            spec,
+            jobs,
+        )
+
+    for title, section_schemas, struct_for_all_of in sections:
+        if not section_schemas:
+            continue
+        write_section_header(title, out)
+        for name, schema in section_schemas:
+            if rendered is None:
+                generate_schema(name, schema, spec, out, struct_for_all_of)
             else:
-                lines.extend(generate_type_alias(name, schema, spec))
-            lines.append("")
+                out.write(next(rendered))
+            out.write("\n")
 
     # Add missing types that the SDK depends on but aren't in the OpenAPI spec
-    lines.append("// " + "=" * 76)
-    lines.append("// Additional Types (not in OpenAPI spec but required by SDK)")
-    lines.append("// " + "=" * 76)
-    lines.append("")
+    write_section_header("Additional Types (not in OpenAPI spec but required by SDK)", out)
 
     # ProvidersResponse - used by list_providers()
-    lines.extend([
-        "/// Response containing available LLM providers.",
-        "#[derive(Debug, Clone, Deserialize)]",
-        "pub struct ProvidersResponse {",
-        "    /// List of available provider names.",
-        "    pub providers: Vec<String>,",
-        "}",
-        "",
-    ])
+    out.write(
+        "/// Response containing available LLM providers.\n"
+        "#[derive(Debug, Clone, Deserialize)]\n"
+        "pub struct ProvidersResponse {\n"
+        "    /// List of available provider names.\n"
+        "    pub providers: Vec<String>,\n"
+        "}\n"
+        "\n"
+    )
 
     # Model type for ModelList items (if not already defined)
     if not any(name == "Model" for name, _ in other_schemas):
-        lines.extend([
-            "/// Available LLM model.",
-            "#[derive(Debug, Clone, Deserialize)]",
-            "pub struct Model {",
-            "    /// Model identifier.",
-            "    pub id: String,",
-            "    /// Display name.",
-            "    pub name: String,",
-            "}",
-            "",
-        ])
+        out.write(
+            "/// Available LLM model.\n"
+            "#[derive(Debug, Clone, Deserialize)]\n"
+            "pub struct Model {\n"
+            "    /// Model identifier.\n"
+            "    pub id: String,\n"
+            "    /// Display name.\n"
+            "    pub name: String,\n"
+            "}\n"
+            "\n"
+        )
 
     # Add type aliases for client.rs compatibility
-    # Only add aliases for types that don't already exist in the schema
-    schema_names = set(schemas.keys())
-
-    lines.extend([
-        "// ==========================================================================",
-        "// Type Aliases for Client Compatibility",
-        "// ==========================================================================",
-        "",
-    ])
+    out.write(
+        "// ==========================================================================\n"
+        "// Type Aliases for Client Compatibility\n"
+        "// ==========================================================================\n"
+    )
 
     # Define all aliases - only add if alias name doesn't exist in schema
     type_aliases = [
@@ -594,48 +827,60 @@ def generate_types(spec: dict) -> str:
         ("AnalyzeResponse", "AnalyzeResponseBody", "Analyze response."),
     ]
 
-    for alias_name, target_type, doc in type_aliases:
-        # Skip if alias name already exists in the schema
-        if alias_name in schema_names:
-            continue
-        lines.append(f"/// {doc}")
-        lines.append(f"pub type {alias_name} = {target_type};")
-        lines.append("")
+    # Drop aliases whose name already exists in the schema, keeping declaration order
+    aliases = {
+        alias_name: (target_type, doc)
+        for alias_name, target_type, doc in type_aliases
+        if alias_name not in schemas
+    }
 
-    return "\n".join(lines)
+    for alias_name, (target_type, doc) in aliases.items():
+        # Blank line goes first so the file ends with a single newline
+        out.write(f"\n/// {doc}\npub type {alias_name} = {target_type};\n")
 
 
 def main() -> int:
     """Main entry point."""
     args = parse_args()
 
+    # Resolve paths once up front
+    if args.file:
+        args.file = str(Path(args.file).resolve())
+    output_path = Path(args.output).resolve()
+
     try:
         # Load spec
         if args.file:
-            spec = load_spec_from_file(args.file)
+            spec = load_spec_from_file(args.file, not args.no_cache)
         else:
-            spec = fetch_spec(args.url)
+            spec = fetch_spec(args.url, not args.no_cache)
 
         print(f"OpenAPI version: {spec.get('openapi', 'unknown')}")
         print(f"API title: {spec.get('info', {}).get('title', 'unknown')}")
         print(f"API version: {spec.get('info', {}).get('version', 'unknown')}")
 
-        # Generate types
-        types_code = generate_types(spec)
-
-        # Write output
-        output_path = Path(args.output).resolve()
+        # Generate types straight into the output file. Write to a temporary
+        # file first so a failed run doesn't leave a truncated types.rs behind.
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(f".{output_path.name}.tmp")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(types_code)
+        try:
+            with open(tmp_path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                generate_types(spec, f, args.jobs)
+            os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
         print(f"Types written to: {output_path}")
 
         # Count generated types
         schema_count = len(spec.get("components", {}).get("schemas", {}))
         enum_count = len(inline_enums)
-        print(f"Generated {schema_count} types + {enum_count} inline enums")
+        alias_count = len(inline_enum_aliases)
+        print(
+            f"Generated {schema_count} types + {enum_count} inline enums "
+            f"({alias_count} aliased to an identical enum)"
+        )
 
         return 0
 